@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Response
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, UploadFile, File, Form, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional, Any, Dict
 import logging
@@ -364,7 +365,7 @@ async def analyze_saved_resume(
             detail=str(e)
         )
 
-@router.post("/enhance", response_model=EnhancedResumeData)
+@router.post("/enhance", response_model=EnhancedResumeData, response_class=ORJSONResponse)
 async def enhance_resume_text(
     resume_text: str, 
     current_user: Optional[User] = Depends(get_optional_current_user),
@@ -554,6 +555,7 @@ async def extract_resume_text_only(
 
 @router.post("/process-file", response_model=AIAnalysisResult)
 async def process_resume_file(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     job_description: Optional[str] = Form(None),
     current_user: Optional[User] = Depends(get_optional_current_user),
@@ -659,10 +661,11 @@ async def process_resume_file(
         try:
             # Analyze the extracted text - pass the doc_id and db to update metadata with analysis results
             analysis_result = await analyze_resume(
-                resume_text=extracted_text, 
+                resume_text=extracted_text,
                 job_description=job_description,
                 doc_id=text_doc_id,
-                db=db
+                db=db,
+                background_tasks=background_tasks
             )
             
             # Add document ID to the result
@@ -867,7 +870,7 @@ async def check_if_file_is_resume(
             detail=str(e)
         )
 
-@router.post("/enhance-file", response_model=EnhancedResumeData)
+@router.post("/enhance-file", response_model=EnhancedResumeData, response_class=ORJSONResponse)
 async def enhance_resume_file(
     file: UploadFile = File(...), 
     current_user: Optional[User] = Depends(get_optional_current_user),
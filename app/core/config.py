@@ -21,6 +21,12 @@ class Settings(BaseSettings):
     
     GOOGLE_AI_API_KEY: str = os.getenv("GOOGLE_AI_API_KEY", "")
     GEMINI_MODEL_NAME: str = os.getenv("GEMINI_MODEL_NAME", "gemini-1.5-flash")
+    GEMINI_CONCURRENCY: int = int(os.getenv("GEMINI_CONCURRENCY", "8"))
+
+    # Resume detection short-circuits on heuristic confidence at or beyond
+    # these bounds instead of consulting Gemini
+    RESUME_HEURISTIC_DECIDE_LOW: float = float(os.getenv("RESUME_HEURISTIC_DECIDE_LOW", "0.15"))
+    RESUME_HEURISTIC_DECIDE_HIGH: float = float(os.getenv("RESUME_HEURISTIC_DECIDE_HIGH", "0.85"))
 
     SMTP_HOST: str = os.getenv("SMTP_HOST", "")
     SMTP_PORT: int = int(os.getenv("SMTP_PORT", "587"))
@@ -1,8 +1,39 @@
 from typing import Optional, Dict, List, Any
+import logging
+
+import google.generativeai as genai
+
+from app.core.config import settings
 
 # These functions are simple wrappers that will be used to avoid circular imports
 # The actual implementation is in resume.py
 
+logger = logging.getLogger(__name__)
+
+_genai_configured = False
+
+def configure_google_ai() -> bool:
+    """
+    Configure the google-generativeai SDK once per process.
+
+    Every genai.configure() call rebuilds the underlying transport channel,
+    so the modules that use Gemini share this memoized setup and keep one
+    pooled gRPC channel for all calls.
+
+    Returns:
+        True if the SDK is configured with an API key, False otherwise
+    """
+    global _genai_configured
+    if _genai_configured:
+        return True
+
+    if not settings.GOOGLE_AI_API_KEY:
+        return False
+
+    genai.configure(api_key=settings.GOOGLE_AI_API_KEY, transport="grpc")
+    _genai_configured = True
+    return True
+
 async def analyze_resume_with_ai(resume_text: str, job_description: Optional[str] = None) -> Dict[str, Any]:
     """
     Analyze a resume with AI
@@ -3,26 +3,230 @@ import logging
 from typing import Dict, List, Optional, Any, Tuple
 import json
 
+import ahocorasick
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Contact patterns used by extract_personal_info, compiled once at import
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+_LINK_RE = re.compile(r'(?:linkedin\.com|github\.com|twitter\.com|instagram\.com|facebook\.com)/\S+')
+_ZIP_RE = re.compile(r'\b\d{5}(?:-\d{4})?\b')  # US zip code pattern
+
+# Heuristic keyword tables for extract_personal_info's single line scan
+_SUMMARY_PATTERNS = ('summary', 'profile', 'objective', 'about me', 'professional summary')
+_SECTION_BREAK_PATTERNS = ('experience', 'education', 'skills')
+_NAME_HEADER_WORDS = ('resume', 'cv', 'curriculum', 'vitae')
+# Address indicators matched as whole words; the engine does the case
+# folding so no lowered copy or token list is allocated per line
+_ADDRESS_INDICATOR_RE = re.compile(
+    r'\b(?:st|street|ave|avenue|rd|road|lane|drive|circle|'
+    r'blvd|boulevard|apt|suite|unit|box)\b',
+    re.IGNORECASE
+)
+
+def _build_automaton(words: Tuple[str, ...]) -> "ahocorasick.Automaton":
+    """Compile a set of substrings into one Aho-Corasick automaton."""
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+# Multi-word patterns need substring matching, so the per-line keyword
+# loops run as a single automaton pass instead of one scan per pattern
+_SUMMARY_AC = _build_automaton(_SUMMARY_PATTERNS)
+_SECTION_BREAK_AC = _build_automaton(_SECTION_BREAK_PATTERNS)
+
+def _ac_contains(automaton: "ahocorasick.Automaton", text: str) -> bool:
+    """True when any of the automaton's patterns occurs in text."""
+    return next(automaton.iter(text), None) is not None
+
+# --- Patterns below are compiled once at import so the extractors call ---
+# --- bound methods instead of re-feeding raw strings through re._cache ---
+
+# extract_complete_resume_structure: top-of-resume contact details
+_NAME_TITLE_SPLIT_RE = re.compile(r'\s+[|-]\s+')
+_CONTACT_LINE_RE = re.compile(r'@|[0-9]{3}[-.]?[0-9]{3}[-.]?[0-9]{4}')
+_EMAIL_ANY_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+_PHONE_RES = [
+    re.compile(r'(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),  # Standard format
+    re.compile(r'\+\d{1,3}\s\d{10}'),  # International format with space
+    re.compile(r'\+\d{10,14}')  # Pure international number
+]
+_LOCATION_RES = [
+    re.compile(r'(?:located in|location[:\s]+|based in)\s+([A-Za-z\s]+,\s+[A-Za-z\s]+)', re.IGNORECASE),
+    re.compile(r'([A-Za-z\s]+,\s+[A-Za-z\s]+)(?:\s+\d{5})?', re.IGNORECASE)  # City, State/Country + optional ZIP
+]
+_TOP_LINKS_RE = re.compile(r'(?:linkedin\.com|github\.com|(?:www\.)?[\w\.-]+\.\w{2,})\/[\w\.-]+')
+
+# identify_resume_sections: header patterns per section type
+_SECTION_HEADER_RES = {
+    "experience": [
+        re.compile(r'(?:WORK|PROFESSIONAL)\s+(?:EXPERIENCE|HISTORY)', re.IGNORECASE),
+        re.compile(r'EXPERIENCE', re.IGNORECASE),
+        re.compile(r'EMPLOYMENT(?:\s+HISTORY)?', re.IGNORECASE)
+    ],
+    "education": [
+        re.compile(r'EDUCATION', re.IGNORECASE),
+        re.compile(r'ACADEMIC(?:\s+BACKGROUND|\s+HISTORY)?', re.IGNORECASE),
+        re.compile(r'QUALIFICATIONS', re.IGNORECASE)
+    ],
+    "skills": [
+        re.compile(r'(?:TECHNICAL\s+)?SKILLS', re.IGNORECASE),
+        re.compile(r'CORE\s+COMPETENCIES', re.IGNORECASE),
+        re.compile(r'TECHNOLOGIES', re.IGNORECASE),
+        re.compile(r'PROFICIENCY', re.IGNORECASE)
+    ],
+    "projects": [
+        re.compile(r'PROJECTS', re.IGNORECASE),
+        re.compile(r'(?:PERSONAL|KEY)\s+PROJECTS', re.IGNORECASE),
+        re.compile(r'PROJECT\s+EXPERIENCE', re.IGNORECASE)
+    ]
+}
+
+# extract_work_experience: job-entry splitting and per-line field patterns
+_JOB_SPLIT_RES = [
+    # Pattern 1: Date patterns or company names at beginning of line
+    re.compile(r'\n(?=\d{4}|\d{1,2}/\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-zA-Z]*\.?\s+\d{4}|\d{1,2}/\d{2}|\b(?:[A-Z][a-z]+\s?)+(?:LLC|Inc|Corporation|Corp|Ltd|Company|Technologies|Solutions|Media|Group|International)\b)'),
+
+    # Pattern 2: Job titles at beginning of line
+    re.compile(r'\n(?=(?:Senior|Lead|Principal|Junior|Chief|Head|Director|VP|Vice President|Manager|Engineer|Developer|Architect|Designer|Consultant|Specialist|Analyst|Associate)\b)'),
+
+    # Pattern 3: Bullet point lists often indicate new job sections
+    re.compile(r'\n(?=•|\*|-\s+)'),
+
+    # Pattern 4: Common company names that don't have LLC/Inc, etc.
+    re.compile(r'\n(?=\b(?:Google|Amazon|Microsoft|Apple|Facebook|Netflix|Twitter|Uber|Airbnb|LinkedIn|GitHub|GitLab|Salesforce)\b)')
+]
+_BLANK_LINE_SPLIT_RE = re.compile(r'\n\s*\n')
+_NEWLINE_RE = re.compile(r'\n')
+
+def _trimmed_span_length(content: str, start: int, end: int) -> int:
+    """Length of content[start:end] after stripping, without slicing a copy."""
+    while start < end and content[start].isspace():
+        start += 1
+    while end > start and content[end - 1].isspace():
+        end -= 1
+    return end - start
+
+def _split_at_matches(content: str, pattern: "re.Pattern") -> List[str]:
+    """
+    Split content at each match of pattern using integer offsets.
+
+    Equivalent to re.split for the separator patterns used here (entries
+    are stripped by the callers), but yields plain slices instead of
+    running the split machinery and its separator bookkeeping.
+    """
+    positions = [0] + [m.start() for m in pattern.finditer(content)] + [len(content)]
+    return [content[positions[i]:positions[i + 1]] for i in range(len(positions) - 1)]
+# One scan per line; the title-keyword form is anchored at the start so
+# alternation order matches the old first-pattern-wins loop
+_POSITION_ANY_RE = re.compile(
+    r'^((?:Senior|Lead|Principal|Junior|Chief|Head|Director|VP|Vice President|Manager|Engineer|Developer|Architect|Designer|Consultant|Specialist|Analyst|Associate)[\s\w]+)'
+    r'|(?:Position|Title|Role)[\s:]+([^\n]+)'
+)
+_COMPANY_RES = [
+    re.compile(r'(?:at|with|for)\s+([A-Z][^,\n]+)'),
+    re.compile(r'(?:Company|Employer)[\s:]+([^\n]+)'),
+    re.compile(r'^([A-Z][a-zA-Z0-9\s&\.,]+(?:LLC|Inc|Corporation|Corp|Ltd|Company|Technologies|Solutions|Media|Group|International))')
+]
+_DATE_RANGE_RE = re.compile(r'(\d{1,2}/\d{2,4}|\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-zA-Z]*\.?\s+\d{4})\s*[-–—]\s*(\d{1,2}/\d{2,4}|\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-zA-Z]*\.?\s+\d{4}|Present|Current|Now)')
+_YEAR_TO_YEAR_RE = re.compile(r'(\d{4})\s*to\s*(\d{4}|Present|Current|Now)', re.IGNORECASE)
+_AFTER_DATE_LOCATION_RE = re.compile(r'[-–—]\s*([A-Z][^,\n]+(?:,\s*[A-Z]{2})?)')
+_LABELED_LOCATION_RE = re.compile(r'(?:Location|Based in)[\s:]+([^\n]+)')
+_CITY_STATE_RE = re.compile(r'\b([A-Z][a-zA-Z\s]+,\s*[A-Z]{2})\b')
+_CAPITAL_START_RE = re.compile(r'^[A-Z]')
+_BULLET_MARKER_STRIP_RE = re.compile(r'^[•\*\-]\s*|^\d+\.\s*')
+# Bullet chars need no trailing space (matching the startswith checks this
+# replaces); numbered markers do, so "3.8" isn't taken for a list item
+_BULLET_LINE_RE = re.compile(r'^\s*(?:[•\*\-]|\d+\.\s)')
+
+# extract_education: common education keywords and entry fields
+_DEGREE_KEYWORDS = (
+    "bachelor", "master", "phd", "doctorate", "b.s.", "m.s.", "b.a.", "m.a.",
+    "b.eng", "m.eng", "b.tech", "m.tech", "b.sc", "m.sc", "mba", "llb", "llm",
+    "associate", "diploma", "certificate", "certification", "degree",
+    "bsc", "msc", "ba", "ma", "bs", "ms", "b.e.", "m.e.", "b.com", "m.com"
+)
+_INSTITUTION_KEYWORDS = (
+    "university", "college", "institute", "school", "academy", "polytechnic",
+    "campus", "center", "centre"
+)
+# Entries start on lines holding a degree or institution keyword; the
+# ~400-char alternation is parsed once here instead of per resume
+_EDU_ENTRY_RE = re.compile(
+    r'\n(?=(?:[A-Z][^\n,]*\b(?:' + '|'.join(_DEGREE_KEYWORDS + _INSTITUTION_KEYWORDS)
+    + r')\b[^\n,]*)|(?:\b(?:' + '|'.join(_DEGREE_KEYWORDS + _INSTITUTION_KEYWORDS)
+    + r')\b[^\n,]*))',
+    re.IGNORECASE
+)
+# One alternation scan per line instead of one search per keyword
+_ANY_DEGREE_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(k) for k in _DEGREE_KEYWORDS) + r')\b', re.IGNORECASE
+)
+_INSTITUTION_LINE_RE = re.compile(
+    r'([A-Z][^\n,]*\b(?:' + '|'.join(re.escape(k) for k in _INSTITUTION_KEYWORDS) + r')\b[^\n,]*)',
+    re.IGNORECASE
+)
+_ANY_INSTITUTION_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(k) for k in _INSTITUTION_KEYWORDS) + r')\b', re.IGNORECASE
+)
+_EDU_DATE_SPLIT_RE = re.compile(r'\n(?=\d{4}\s*-\s*\d{4}|\d{4}\s*-\s*(?:Present|Current|Now)|\d{1,2}/\d{4}\s*-\s*\d{1,2}/\d{4})')
+_DEGREE_FULL_RE = re.compile(r'((?:B|M|Ph)(?:\.|Sc|A|S|Eng|Tech)\.?|Bachelor(?:s|\'s)?|Master(?:s|\'s)?|MBA|Ph\.?D\.?|Doctor(?:ate)?|Associate(?:s|\'s)?)[^\n,]*(?:(?:of|in|on)\s+[^\n,]+)?', re.IGNORECASE)
+_EDU_DATE_RANGE_RE = re.compile(r'(\d{1,2}/\d{2,4}|\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-zA-Z]*\.?\s+\d{4})\s*[-–—]\s*(\d{1,2}/\d{2,4}|\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-zA-Z]*\.?\s+\d{4}|Present|Current|Now|Expected)', re.IGNORECASE)
+_CITY_STATE_OR_COUNTRY_RE = re.compile(r'([A-Z][a-zA-Z\s]+,\s*[A-Z]{2}|[A-Z][a-zA-Z\s]+,\s*[A-Z][a-zA-Z\s]+)')
+_GPA_RE = re.compile(r'GPA\s*(?:of|:)?\s*(\d+\.\d+|\d+\,\d+)', re.IGNORECASE)
+_WS_RUN_RE = re.compile(r'\s+')
+_BACHELOR_RE = re.compile(r'\bbach|b\.?s|b\.?a|b\.?eng|b\.?tech\b')
+_MASTER_RE = re.compile(r'\bmast|m\.?s|m\.?a|m\.?eng|m\.?tech\b')
+_PHD_RE = re.compile(r'\bphd|ph\.?d|doct\b')
+_ASSOCIATE_RE = re.compile(r'\bassoc|a\.?a\b')
+
+# extract_skills / extract_projects
+_SKILL_BULLET_RE = re.compile(r'[•\-\*]\s*([^•\-\*\n]+)')
+_PROJECT_ENTRY_RE = re.compile(r'([A-Z][A-Za-z0-9\s&\-\'\(\)]+)(?:\n|\s{2,})(.+?)(?=(?:[A-Z][A-Za-z0-9\s&\-\'\(\)]+(?:\n|\s{2,}))|$)', re.DOTALL)
+_TECH_STACK_RE = re.compile(r'(?:technologies|tech stack|built with)[:\s]*([^\.]+)', re.IGNORECASE)
+_URL_RE = re.compile(r'(https?://(?:www\.)?[a-zA-Z0-9\.\-]+\.[a-zA-Z]{2,}(?:/[a-zA-Z0-9\.\-_~:/\?#\[\]@!\$&\'\(\)\*\+,;=]*)?)')
+_BULLET_CHAR_STRIP_RE = re.compile(r'^[•\*\-]\s*')
+
+# extract_summary
+_CAPS_HEADER_RE = re.compile(r'\n[A-Z][A-Z\s]+:?(?:\n|$)')
+_BULLET_LINE_START_RE = re.compile(r'(?:\n|^)[•\*\-]\s')
+_BULLET_TEXT_RE = re.compile(r'[•\*\-]\s+([^\n•\*\-]+)')
+_SUMMARY_HEADER_RES = [
+    re.compile(r'(?:\n|^)' + header + r'[:\s]*\n+(.+?)(?=\n\n|\n[A-Z][A-Z\s]+:?|\Z)', re.IGNORECASE | re.DOTALL)
+    for header in (
+        r'SUMMARY', r'PROFESSIONAL SUMMARY', r'CAREER SUMMARY',
+        r'OBJECTIVE', r'CAREER OBJECTIVE', r'PROFESSIONAL OBJECTIVE',
+        r'PROFILE', r'PROFESSIONAL PROFILE', r'ABOUT ME'
+    )
+]
+_SUMMARY_LABEL_RE = re.compile(r'^(?:Summary|Objective|Profile|About):\s*', re.IGNORECASE)
+_INTRO_SECTION_WORD_RE = re.compile(r'(?:EXPERIENCE|EDUCATION|SKILLS|PROJECTS|WORK|EMPLOYMENT)\b', re.IGNORECASE)
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Common resume section keywords for check_resume_heuristics; scanned in
+# one automaton pass instead of one substring search per keyword
+_RESUME_SECTIONS = (
+    "experience", "education", "skills", "employment", "work history",
+    "professional experience", "qualification", "certification", "achievement",
+    "objective", "summary", "profile", "project", "language", "reference",
+    "volunteer", "training", "award", "publication"
+)
+_RESUME_SECTION_AC = _build_automaton(_RESUME_SECTIONS)
+
 def check_resume_heuristics(text: str) -> Dict[str, Any]:
     """
     Quickly check if text is likely a resume using heuristics
     """
-    # Common resume section keywords
-    resume_sections = [
-        "experience", "education", "skills", "employment", "work history",
-        "professional experience", "qualification", "certification", "achievement",
-        "objective", "summary", "profile", "project", "language", "reference",
-        "volunteer", "training", "award", "publication"
-    ]
-    
     # Convert to lowercase for case-insensitive matching
     lower_text = text.lower()
-    
-    # Count matches
-    matched_sections = [section for section in resume_sections if section in lower_text]
+
+    # Count matches, keeping the keyword-table order in the report
+    found = {keyword for _, keyword in _RESUME_SECTION_AC.iter(lower_text)}
+    matched_sections = [section for section in _RESUME_SECTIONS if section in found]
     match_count = len(matched_sections)
     
     # Calculate confidence
@@ -50,7 +254,8 @@ async def extract_personal_info(text: str) -> Dict[str, Any]:
     Extract personal information from a resume text
     Returns name, email, phone, address, links
     """
-    if not text:
+    # Too short to hold any contact details; skip all the scans
+    if not text or len(text.strip()) < 20:
         return {
             "name": None,
             "email": None,
@@ -72,75 +277,82 @@ async def extract_personal_info(text: str) -> Dict[str, Any]:
     lines = text.split('\n')
     
     # Look for email address
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    email_match = re.search(email_pattern, text)
+    email_match = _EMAIL_RE.search(text)
     if email_match:
         result["email"] = email_match.group(0)
-    
+
     # Look for phone number
-    phone_pattern = r'(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-    phone_match = re.search(phone_pattern, text)
+    phone_match = _PHONE_RE.search(text)
     if phone_match:
         result["phone"] = phone_match.group(0)
-        
+
     # Look for LinkedIn or other profile links
-    link_pattern = r'(?:linkedin\.com|github\.com|twitter\.com|instagram\.com|facebook\.com)/\S+'
-    link_matches = re.findall(link_pattern, text)
-    result["links"] = link_matches
+    result["links"] = _LINK_RE.findall(text)
     
-    # Look for name (typically in the first 10 lines, looking for capitalized words)
+    # One pass over the lines gathers the name, the profile-section header
+    # candidates, and the address together instead of three traversals.
+    # The whole-text precheck decides whether header matching is worth doing.
     name_found = False
-    for i in range(min(10, len(lines))):
-        line = lines[i].strip()
-        # Skip empty lines and lines with common header text
-        if not line or any(x in line.lower() for x in ['resume', 'cv', 'curriculum', 'vitae']):
-            continue
-            
-        # Look for a line with 1-3 words, all capitalized
-        words = line.split()
-        if 1 <= len(words) <= 3:
-            capitalized_words = [w for w in words if w[0].isupper()]
-            if len(capitalized_words) == len(words):
+    summary_header_indices = []
+    scan_for_summary = _ac_contains(_SUMMARY_AC, text.lower())
+
+    for i, raw_line in enumerate(lines):
+        line = raw_line.strip()
+        line_lower = line.lower()
+
+        # Name: typically in the first 10 lines, 1-3 capitalized words,
+        # skipping empty lines and common header text
+        if (not name_found and i < 10 and line
+                and not any(x in line_lower for x in _NAME_HEADER_WORDS)):
+            words = line.split()
+            if 1 <= len(words) <= 3 and all(w[0].isupper() for w in words):
                 result["name"] = line
                 name_found = True
-                break
-    
+
+        # Profile/summary headers: remember them for extraction below
+        if scan_for_summary and _ac_contains(_SUMMARY_AC, line_lower):
+            summary_header_indices.append(i)
+
+        # Address: line with a whole-word location token or a zip code
+        if result["address"] is None and len(line) > 10:
+            if _ADDRESS_INDICATOR_RE.search(line) or _ZIP_RE.search(line):
+                # Skip lines that contain email or phone
+                if not ((result["email"] and result["email"] in line) or
+                        (result["phone"] and result["phone"] in line)):
+                    result["address"] = line
+
     # If we didn't find a name with the above method, try another approach
     if not name_found and len(lines) > 0:
         # Take the first non-empty line that doesn't contain email or phone
         for i in range(min(5, len(lines))):
-            if (lines[i].strip() and 
+            if (lines[i].strip() and
                 (result["email"] is None or result["email"] not in lines[i]) and
                 (result["phone"] is None or result["phone"] not in lines[i])):
                 result["name"] = lines[i].strip()
                 break
-    
-    # Extract potential profile/summary section
+
+    # Extract potential profile/summary section from the recorded headers
     profile_section = None
-    
-    # Look for dedicated profile/summary section
-    summary_patterns = ['summary', 'profile', 'objective', 'about me', 'professional summary']
-    for i, line in enumerate(lines):
-        if any(pattern in line.lower() for pattern in summary_patterns):
-            # Found a section header, extract the section content (next few lines)
-            start = i + 1
-            end = start
-            while end < len(lines) and end < start + 10:
-                if any(pattern in lines[end].lower() for pattern in ['experience', 'education', 'skills']):
-                    break  # Stop at next section header
-                end += 1
-            if end > start:
-                profile_section = '\n'.join(lines[start:end]).strip()
-                break
-    
+    for i in summary_header_indices:
+        # Found a section header, extract the section content (next few lines)
+        start = i + 1
+        end = start
+        while end < len(lines) and end < start + 10:
+            if _ac_contains(_SECTION_BREAK_AC, lines[end].lower()):
+                break  # Stop at next section header
+            end += 1
+        if end > start:
+            profile_section = '\n'.join(lines[start:end]).strip()
+            break
+
     # If no dedicated section found, take the first paragraph that's not the name/contact info
     if not profile_section:
         for i in range(min(10, len(lines))):
             email_str = result["email"] if result["email"] else ""
             phone_str = result["phone"] if result["phone"] else ""
             name_str = result["name"] if result["name"] else ""
-            
-            if (lines[i].strip() and 
+
+            if (lines[i].strip() and
                 all((info is None or info not in lines[i].lower()) for info in [email_str, phone_str, name_str] if info)):
                 # This line doesn't contain already-extracted info, might be profile
                 # Collect this and following lines as a paragraph
@@ -151,28 +363,11 @@ async def extract_personal_info(text: str) -> Dict[str, Any]:
                 if end - start > 1:  # Must be at least 2 lines to be considered a paragraph
                     profile_section = "\n".join(lines[start:end])
                     break
-    
+
     # Add profile text to result
     if profile_section:
         result["profile"] = profile_section
-    
-    # Extract address (simple heuristic - line with location indicators)
-    address_indicators = ['st', 'street', 'ave', 'avenue', 'rd', 'road', 'lane', 'drive', 'circle', 
-                         'blvd', 'boulevard', 'apt', 'suite', 'unit', 'box']
-    
-    for i, line in enumerate(lines):
-        line_lower = line.lower()
-        has_address_indicator = any(f" {indicator} " in f" {line_lower} " for indicator in address_indicators)
-        has_zip = bool(re.search(r'\b\d{5}(?:-\d{4})?\b', line))  # US zip code pattern
-        
-        if (has_address_indicator or has_zip) and len(line.strip()) > 10:
-            # Skip lines that contain email or phone
-            if (result["email"] and result["email"] in line) or (result["phone"] and result["phone"] in line):
-                continue
-            
-            result["address"] = line.strip()
-            break
-            
+
     return result
 
 async def extract_complete_resume_structure(resume_text: str) -> Dict[str, Any]:
@@ -200,9 +395,9 @@ async def extract_complete_resume_structure(resume_text: str) -> Dict[str, Any]:
             "projects": []
         }
         
-        # Split the text into lines for processing
-        lines = resume_text.split('\n')
-        clean_lines = [line.strip() for line in lines if line.strip()]
+        # Split the text into lines once; only the top two non-blank lines
+        # are needed for the name/title heuristics below
+        clean_lines = [line.strip() for line in resume_text.split('\n') if line.strip()]
         
         # Extract personal information first
         personal_info = {}
@@ -212,7 +407,7 @@ async def extract_complete_resume_structure(resume_text: str) -> Dict[str, Any]:
             name_line = clean_lines[0]
             
             # Check if the first line contains a name and title
-            name_title_split = re.split(r'\s+[|-]\s+', name_line, 1)
+            name_title_split = _NAME_TITLE_SPLIT_RE.split(name_line, 1)
             if len(name_title_split) > 1:
                 personal_info["name"] = name_title_split[0].strip()
                 personal_info["title"] = name_title_split[1].strip()
@@ -224,43 +419,30 @@ async def extract_complete_resume_structure(resume_text: str) -> Dict[str, Any]:
                 if len(clean_lines) > 1:
                     second_line = clean_lines[1]
                     # Check if it looks like a job title (not an email or phone)
-                    if not re.search(r'@|[0-9]{3}[-.]?[0-9]{3}[-.]?[0-9]{4}', second_line):
+                    if not _CONTACT_LINE_RE.search(second_line):
                         personal_info["title"] = second_line
         
         # Extract email using regex
-        email_pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
-        email_matches = re.findall(email_pattern, resume_text)
+        email_matches = _EMAIL_ANY_RE.findall(resume_text)
         if email_matches:
             personal_info["email"] = email_matches[0]
-        
+
         # Extract phone number using multiple patterns
-        phone_patterns = [
-            r'(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # Standard format
-            r'\+\d{1,3}\s\d{10}',  # International format with space
-            r'\+\d{10,14}'  # Pure international number
-        ]
-        
-        for pattern in phone_patterns:
-            phone_matches = re.findall(pattern, resume_text)
+        for pattern in _PHONE_RES:
+            phone_matches = pattern.findall(resume_text)
             if phone_matches:
                 personal_info["phone"] = phone_matches[0]
                 break
-        
+
         # Extract location - this is often near the top with email/phone
-        location_patterns = [
-            r'(?:located in|location[:\s]+|based in)\s+([A-Za-z\s]+,\s+[A-Za-z\s]+)',
-            r'([A-Za-z\s]+,\s+[A-Za-z\s]+)(?:\s+\d{5})?'  # City, State/Country + optional ZIP
-        ]
-        
-        for pattern in location_patterns:
-            location_match = re.search(pattern, resume_text[:500], re.IGNORECASE)  # Only search top part
+        for pattern in _LOCATION_RES:
+            location_match = pattern.search(resume_text[:500])  # Only search top part
             if location_match:
                 personal_info["location"] = location_match.group(1).strip()
                 break
-        
+
         # Look for LinkedIn/website/portfolio near the top
-        links_pattern = r'(?:linkedin\.com|github\.com|(?:www\.)?[\w\.-]+\.\w{2,})\/[\w\.-]+'
-        links_match = re.search(links_pattern, resume_text[:500])
+        links_match = _TOP_LINKS_RE.search(resume_text[:500])
         if links_match:
             personal_info["links"] = links_match.group(0)
         
@@ -280,9 +462,9 @@ async def extract_complete_resume_structure(resume_text: str) -> Dict[str, Any]:
             education = extract_education(resume_text, sections["education"])
             resume_structure["education"] = education
         
-        # Extract skills
+        # Extract skills, reusing the section map computed above
         if "skills" in sections:
-            skills = extract_skills(resume_text, sections["skills"])
+            skills = extract_skills(resume_text, sections["skills"], sections)
             resume_structure["skills"] = skills
         
         # Extract projects
@@ -318,41 +500,15 @@ def identify_resume_sections(text: str) -> Dict[str, Tuple[int, int]]:
     Returns:
         Dictionary mapping section types to (start, end) positions
     """
-    # Define section header patterns
-    section_patterns = {
-        "experience": [
-            r'(?:WORK|PROFESSIONAL)\s+(?:EXPERIENCE|HISTORY)',
-            r'EXPERIENCE',
-            r'EMPLOYMENT(?:\s+HISTORY)?'
-        ],
-        "education": [
-            r'EDUCATION',
-            r'ACADEMIC(?:\s+BACKGROUND|\s+HISTORY)?',
-            r'QUALIFICATIONS'
-        ],
-        "skills": [
-            r'(?:TECHNICAL\s+)?SKILLS',
-            r'CORE\s+COMPETENCIES',
-            r'TECHNOLOGIES',
-            r'PROFICIENCY'
-        ],
-        "projects": [
-            r'PROJECTS',
-            r'(?:PERSONAL|KEY)\s+PROJECTS',
-            r'PROJECT\s+EXPERIENCE'
-        ]
-    }
-    
     # Initialize result
     sections = {}
-    
+
     # Find all section headers
     section_matches = []
-    
-    for section_type, patterns in section_patterns.items():
+
+    for section_type, patterns in _SECTION_HEADER_RES.items():
         for pattern in patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+            for match in pattern.finditer(text):
                 section_matches.append((section_type, match.start(), match.group()))
     
     # Sort matches by position
@@ -389,41 +545,46 @@ def extract_work_experience(text: str, section_range: Tuple[int, int]) -> List[D
     section_lines = section_text.split('\n')
     section_content = '\n'.join(section_lines[1:])
     
-    # Try multiple strategies for job entry detection
-    # First try the date/company pattern (most common)
-    job_patterns = [
-        # Pattern 1: Date patterns or company names at beginning of line
-        r'\n(?=\d{4}|\d{1,2}/\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-zA-Z]*\.?\s+\d{4}|\d{1,2}/\d{2}|\b(?:[A-Z][a-z]+\s?)+(?:LLC|Inc|Corporation|Corp|Ltd|Company|Technologies|Solutions|Media|Group|International)\b)',
-        
-        # Pattern 2: Job titles at beginning of line
-        r'\n(?=(?:Senior|Lead|Principal|Junior|Chief|Head|Director|VP|Vice President|Manager|Engineer|Developer|Architect|Designer|Consultant|Specialist|Analyst|Associate)\b)',
-        
-        # Pattern 3: Bullet point lists often indicate new job sections
-        r'\n(?=•|\*|-\s+)',
-        
-        # Pattern 4: Common company names that don't have LLC/Inc, etc.
-        r'\n(?=\b(?:Google|Amazon|Microsoft|Apple|Facebook|Netflix|Twitter|Uber|Airbnb|LinkedIn|GitHub|GitLab|Salesforce)\b)'
-    ]
-    
-    # Try each pattern and use the best result
-    best_entries = []
+    # Try multiple strategies for job entry detection. One pass over the
+    # newline boundaries tags which job patterns would split there,
+    # replacing four full re.split scans of the section
+    boundary_buckets = [[] for _ in _JOB_SPLIT_RES]
+    for newline_match in _NEWLINE_RE.finditer(section_content):
+        pos = newline_match.start()
+        for bucket, pattern in zip(boundary_buckets, _JOB_SPLIT_RES):
+            if pattern.match(section_content, pos):
+                bucket.append(pos)
+
+    # Pick the pattern whose boundaries yield the most substantial entries,
+    # counting by offsets and materializing slices for the winner only
+    best_bounds = None
     best_entry_count = 0
-    
-    for pattern in job_patterns:
-        job_entries = re.split(pattern, section_content)
-        
-        # Filter out empty entries and too-short entries
-        entries = [entry.strip() for entry in job_entries if len(entry.strip()) > 20]
-        
-        if len(entries) > best_entry_count:
-            best_entries = entries
-            best_entry_count = len(entries)
-    
+    content_len = len(section_content)
+    for positions in boundary_buckets:
+        bounds = [0] + positions + [content_len]
+        count = sum(
+            1 for j in range(len(bounds) - 1)
+            if _trimmed_span_length(section_content, bounds[j], bounds[j + 1]) > 20
+        )
+        if count > best_entry_count:
+            best_bounds = bounds
+            best_entry_count = count
+
+    best_entries = []
+    if best_bounds:
+        for j in range(len(best_bounds) - 1):
+            entry = section_content[best_bounds[j]:best_bounds[j + 1]].strip()
+            if len(entry) > 20:
+                best_entries.append(entry)
+
     # If we still don't have good entries, try simpler paragraph splitting
     if best_entry_count <= 1:
         # Look for consecutive blank lines as job separators
-        job_entries = re.split(r'\n\s*\n', section_content)
-        best_entries = [entry.strip() for entry in job_entries if len(entry.strip()) > 20]
+        best_entries = []
+        for raw_entry in _split_at_matches(section_content, _BLANK_LINE_SPLIT_RE):
+            entry = raw_entry.strip()
+            if len(entry) > 20:
+                best_entries.append(entry)
     
     # Process each job entry
     for i, entry in enumerate(best_entries):
@@ -442,18 +603,6 @@ def extract_work_experience(text: str, section_range: Tuple[int, int]) -> List[D
         location_found = False
         dates_found = False
         
-        # Position and company patterns
-        position_patterns = [
-            r'^((?:Senior|Lead|Principal|Junior|Chief|Head|Director|VP|Vice President|Manager|Engineer|Developer|Architect|Designer|Consultant|Specialist|Analyst|Associate)[\s\w]+)',
-            r'(?:Position|Title|Role)[\s:]+([^\n]+)'
-        ]
-        
-        company_patterns = [
-            r'(?:at|with|for)\s+([A-Z][^,\n]+)',
-            r'(?:Company|Employer)[\s:]+([^\n]+)',
-            r'^([A-Z][a-zA-Z0-9\s&\.,]+(?:LLC|Inc|Corporation|Corp|Ltd|Company|Technologies|Solutions|Media|Group|International))'
-        ]
-        
         # Parse the first few lines for key information
         for idx, line in enumerate(lines[:3]):
             # Skip empty lines
@@ -462,17 +611,15 @@ def extract_work_experience(text: str, section_range: Tuple[int, int]) -> List[D
                 
             # Check for position in this line
             if not position_found:
-                for pattern in position_patterns:
-                    position_match = re.search(pattern, line)
-                    if position_match:
-                        job["position"] = position_match.group(1).strip()
-                        position_found = True
-                        break
+                position_match = _POSITION_ANY_RE.search(line)
+                if position_match:
+                    job["position"] = (position_match.group(1) or position_match.group(2)).strip()
+                    position_found = True
                         
             # Check for company in this line
             if not company_found:
-                for pattern in company_patterns:
-                    company_match = re.search(pattern, line)
+                for pattern in _COMPANY_RES:
+                    company_match = pattern.search(line)
                     if company_match:
                         job["company"] = company_match.group(1).strip()
                         company_found = True
@@ -480,15 +627,15 @@ def extract_work_experience(text: str, section_range: Tuple[int, int]) -> List[D
             
             # Look for dates
             if not dates_found:
-                date_match = re.search(r'(\d{1,2}/\d{2,4}|\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-zA-Z]*\.?\s+\d{4})\s*[-–—]\s*(\d{1,2}/\d{2,4}|\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-zA-Z]*\.?\s+\d{4}|Present|Current|Now)', line)
+                date_match = _DATE_RANGE_RE.search(line)
                 if date_match:
                     job["startDate"] = date_match.group(1).strip()
                     job["endDate"] = date_match.group(2).strip()
                     job["current"] = "present" in date_match.group(2).lower() or "current" in date_match.group(2).lower() or "now" in date_match.group(2).lower()
                     dates_found = True
-                    
+
                     # Often location appears after dates
-                    location_match = re.search(r'[-–—]\s*([A-Z][^,\n]+(?:,\s*[A-Z]{2})?)', line)
+                    location_match = _AFTER_DATE_LOCATION_RE.search(line)
                     if location_match:
                         job["location"] = location_match.group(1).strip()
                         location_found = True
@@ -500,25 +647,25 @@ def extract_work_experience(text: str, section_range: Tuple[int, int]) -> List[D
             
         if not company_found and len(lines) > 1 and position_found:
             # Check if the second line looks like a company name (starts with capital letter)
-            if re.match(r'^[A-Z]', lines[1].strip()):
+            if _CAPITAL_START_RE.match(lines[1].strip()):
                 job["company"] = lines[1].strip()
                 company_found = True
             # Try the third line if available
-            elif len(lines) > 2 and re.match(r'^[A-Z]', lines[2].strip()):
+            elif len(lines) > 2 and _CAPITAL_START_RE.match(lines[2].strip()):
                 job["company"] = lines[2].strip()
                 company_found = True
         
         # Extract location if not found yet
         if not location_found:
             for line in lines[:5]:
-                location_match = re.search(r'(?:Location|Based in)[\s:]+([^\n]+)', line)
+                location_match = _LABELED_LOCATION_RE.search(line)
                 if location_match:
                     job["location"] = location_match.group(1).strip()
                     location_found = True
                     break
-                    
+
                 # Look for common location patterns (City, State)
-                location_match = re.search(r'\b([A-Z][a-zA-Z\s]+,\s*[A-Z]{2})\b', line)
+                location_match = _CITY_STATE_RE.search(line)
                 if location_match:
                     job["location"] = location_match.group(1).strip()
                     location_found = True
@@ -527,7 +674,7 @@ def extract_work_experience(text: str, section_range: Tuple[int, int]) -> List[D
         # Extract date range if not found yet
         if not dates_found:
             for line in lines[:5]:
-                date_match = re.search(r'(\d{1,2}/\d{2,4}|\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-zA-Z]*\.?\s+\d{4})\s*[-–—]\s*(\d{1,2}/\d{2,4}|\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-zA-Z]*\.?\s+\d{4}|Present|Current|Now)', line)
+                date_match = _DATE_RANGE_RE.search(line)
                 if date_match:
                     job["startDate"] = date_match.group(1).strip()
                     job["endDate"] = date_match.group(2).strip()
@@ -536,7 +683,7 @@ def extract_work_experience(text: str, section_range: Tuple[int, int]) -> List[D
                     break
                     
                 # Try alternative date formats
-                date_match = re.search(r'(\d{4})\s*to\s*(\d{4}|Present|Current|Now)', line, re.IGNORECASE)
+                date_match = _YEAR_TO_YEAR_RE.search(line)
                 if date_match:
                     job["startDate"] = date_match.group(1).strip()
                     job["endDate"] = date_match.group(2).strip()
@@ -550,12 +697,7 @@ def extract_work_experience(text: str, section_range: Tuple[int, int]) -> List[D
         
         # Find where description starts (after position, company, dates info)
         for idx, line in enumerate(lines):
-            if idx > 0 and (
-                line.strip().startswith('•') or 
-                line.strip().startswith('-') or 
-                line.strip().startswith('*') or
-                re.match(r'^\d+\.\s', line.strip())
-            ):
+            if idx > 0 and _BULLET_LINE_RE.match(line):
                 description_start = idx
                 break
                 
@@ -594,11 +736,7 @@ def extract_job_description(description_lines: List[str]) -> str:
         return ""
         
     # Check if we have bullet points
-    has_bullets = any(
-        line.strip().startswith(('•', '-', '*')) or 
-        re.match(r'^\d+\.\s', line.strip())
-        for line in description_lines
-    )
+    has_bullets = any(_BULLET_LINE_RE.match(line) for line in description_lines)
     
     if has_bullets:
         # Process bullet points
@@ -609,14 +747,14 @@ def extract_job_description(description_lines: List[str]) -> str:
             line = line.strip()
             
             # Start of a new bullet point
-            if line.startswith(('•', '-', '*')) or re.match(r'^\d+\.\s', line):
+            if _BULLET_LINE_RE.match(line):
                 # Save previous bullet if any
                 if current_bullet:
                     bullets.append(' '.join(current_bullet))
                     current_bullet = []
                 
                 # Clean bullet marker and start new bullet
-                clean_line = re.sub(r'^[•\*\-]\s*|^\d+\.\s*', '', line)
+                clean_line = _BULLET_MARKER_STRIP_RE.sub('', line)
                 current_bullet.append(clean_line)
             
             # Continuation of previous bullet point (indented line)
@@ -635,12 +773,15 @@ def extract_job_description(description_lines: List[str]) -> str:
         if current_bullet:
             bullets.append(' '.join(current_bullet))
         
-        # Format as HTML list
-        bullets_html = [f"<li>{bullet}</li>" for bullet in bullets if bullet.strip()]
-        if bullets_html:
-            return f"<ul>{' '.join(bullets_html)}</ul>"
-        else:
-            return ""
+        # Format as HTML list, accumulating parts for a single join
+        parts = ['<ul>']
+        for bullet in bullets:
+            if bullet.strip():
+                parts.append('<li>')
+                parts.append(bullet)
+                parts.append('</li>')
+        parts.append('</ul>')
+        return ''.join(parts) if len(parts) > 2 else ""
     else:
         # Format as paragraphs
         paragraphs = []
@@ -660,9 +801,14 @@ def extract_job_description(description_lines: List[str]) -> str:
         if current_para:
             paragraphs.append(' '.join(current_para))
         
-        # Format as HTML paragraphs
-        paragraphs_html = [f"<p>{para}</p>" for para in paragraphs if para.strip()]
-        return ''.join(paragraphs_html)
+        # Format as HTML paragraphs, accumulating parts for a single join
+        parts = []
+        for para in paragraphs:
+            if para.strip():
+                parts.append('<p>')
+                parts.append(para)
+                parts.append('</p>')
+        return ''.join(parts)
 
 def extract_education(text: str, section_range: Tuple[int, int]) -> List[Dict[str, str]]:
     """
@@ -682,34 +828,19 @@ def extract_education(text: str, section_range: Tuple[int, int]) -> List[Dict[st
     section_lines = section_text.split('\n')
     section_content = '\n'.join(section_lines[1:])
     
-    # Define common education patterns for better recognition
-    degree_keywords = [
-        "bachelor", "master", "phd", "doctorate", "b.s.", "m.s.", "b.a.", "m.a.",
-        "b.eng", "m.eng", "b.tech", "m.tech", "b.sc", "m.sc", "mba", "llb", "llm",
-        "associate", "diploma", "certificate", "certification", "degree",
-        "bsc", "msc", "ba", "ma", "bs", "ms", "b.e.", "m.e.", "b.com", "m.com"
-    ]
-    
-    institution_keywords = [
-        "university", "college", "institute", "school", "academy", "polytechnic", 
-        "campus", "center", "centre"
-    ]
-    
     # Try to identify individual education entries
     # Multiple techniques for splitting education entries
-    
+
     # Method 1: Identify entries by degree or institution keywords
-    entry_pattern = r'\n(?=(?:[A-Z][^\n,]*\b(?:' + '|'.join(degree_keywords + institution_keywords) + r')\b[^\n,]*)|(?:\b(?:' + '|'.join(degree_keywords + institution_keywords) + r')\b[^\n,]*))'
-    edu_entries = re.split(entry_pattern, section_content, flags=re.IGNORECASE)
+    edu_entries = _split_at_matches(section_content, _EDU_ENTRY_RE)
     
     # Method 2: If first method doesn't find at least 2 entries, try date-based splitting
     if len(edu_entries) < 2:
-        date_pattern = r'\n(?=\d{4}\s*-\s*\d{4}|\d{4}\s*-\s*(?:Present|Current|Now)|\d{1,2}/\d{4}\s*-\s*\d{1,2}/\d{4})'
-        edu_entries = re.split(date_pattern, section_content)
-    
+        edu_entries = _split_at_matches(section_content, _EDU_DATE_SPLIT_RE)
+
     # Method 3: If still not enough entries, try blank line separation
     if len(edu_entries) < 2:
-        edu_entries = re.split(r'\n\s*\n', section_content)
+        edu_entries = _split_at_matches(section_content, _BLANK_LINE_SPLIT_RE)
     
     # Process each education entry
     for i, entry in enumerate(edu_entries):
@@ -738,56 +869,43 @@ def extract_education(text: str, section_range: Tuple[int, int]) -> List[Dict[st
                 continue
             
             # Try to extract degree
-            if not degree_found:
-                # Look for common degree patterns
-                for keyword in degree_keywords:
-                    if re.search(r'\b' + re.escape(keyword) + r'\b', line, re.IGNORECASE):
-                        # Try to extract the full degree
-                        degree_match = re.search(r'((?:B|M|Ph)(?:\.|Sc|A|S|Eng|Tech)\.?|Bachelor(?:s|\'s)?|Master(?:s|\'s)?|MBA|Ph\.?D\.?|Doctor(?:ate)?|Associate(?:s|\'s)?)[^\n,]*(?:(?:of|in|on)\s+[^\n,]+)?', line, re.IGNORECASE)
-                        if degree_match:
-                            degree = degree_match.group(0).strip()
-                            # Clean up and standardize the degree
-                            degree = re.sub(r'\s+', ' ', degree)
-                            edu["degree"] = degree
-                            degree_found = True
-                            break
-                        else:
-                            # If not a specific match, just use the line containing the keyword
-                            edu["degree"] = line
-                            degree_found = True
-                            break
-            
+            if not degree_found and _ANY_DEGREE_RE.search(line):
+                # Try to extract the full degree
+                degree_match = _DEGREE_FULL_RE.search(line)
+                if degree_match:
+                    degree = degree_match.group(0).strip()
+                    # Clean up and standardize the degree
+                    edu["degree"] = _WS_RUN_RE.sub(' ', degree)
+                else:
+                    # If not a specific match, just use the line containing the keyword
+                    edu["degree"] = line
+                degree_found = True
+
             # Try to extract institution
-            if not institution_found:
-                for keyword in institution_keywords:
-                    if re.search(r'\b' + re.escape(keyword) + r'\b', line, re.IGNORECASE):
-                        # Try to extract the full institution name
-                        # University names often start with a capital letter and include the keyword
-                        institution_match = re.search(r'([A-Z][^\n,]*\b' + re.escape(keyword) + r'\b[^\n,]*)', line, re.IGNORECASE)
-                        if institution_match:
-                            institution = institution_match.group(0).strip()
-                            # Clean up and standardize the institution
-                            institution = re.sub(r'\s+', ' ', institution)
-                            edu["institution"] = institution
-                            institution_found = True
-                            break
-                        else:
-                            # If not a specific match, just use the line containing the keyword
-                            edu["institution"] = line
-                            institution_found = True
-                            break
+            if not institution_found and _ANY_INSTITUTION_RE.search(line):
+                # Try to extract the full institution name
+                # University names often start with a capital letter and include the keyword
+                institution_match = _INSTITUTION_LINE_RE.search(line)
+                if institution_match:
+                    institution = institution_match.group(0).strip()
+                    # Clean up and standardize the institution
+                    edu["institution"] = _WS_RUN_RE.sub(' ', institution)
+                else:
+                    # If not a specific match, just use the line containing the keyword
+                    edu["institution"] = line
+                institution_found = True
             
             # Try to extract dates
             if not dates_found:
                 # Look for date patterns (start-end)
-                date_match = re.search(r'(\d{1,2}/\d{2,4}|\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-zA-Z]*\.?\s+\d{4})\s*[-–—]\s*(\d{1,2}/\d{2,4}|\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-zA-Z]*\.?\s+\d{4}|Present|Current|Now|Expected)', line, re.IGNORECASE)
+                date_match = _EDU_DATE_RANGE_RE.search(line)
                 if date_match:
                     edu["startDate"] = date_match.group(1).strip()
                     edu["endDate"] = date_match.group(2).strip()
                     dates_found = True
-                    
+
                     # Location often appears with dates
-                    loc_match = re.search(r'([A-Z][a-zA-Z\s]+,\s*[A-Z]{2})', line)
+                    loc_match = _CITY_STATE_RE.search(line)
                     if loc_match:
                         edu["location"] = loc_match.group(1).strip()
                         location_found = True
@@ -795,28 +913,28 @@ def extract_education(text: str, section_range: Tuple[int, int]) -> List[Dict[st
             # Try to extract location if not found yet
             if not location_found:
                 # Look for common location patterns (City, State/Country)
-                loc_match = re.search(r'([A-Z][a-zA-Z\s]+,\s*[A-Z]{2}|[A-Z][a-zA-Z\s]+,\s*[A-Z][a-zA-Z\s]+)', line)
+                loc_match = _CITY_STATE_OR_COUNTRY_RE.search(line)
                 if loc_match:
                     edu["location"] = loc_match.group(1).strip()
                     location_found = True
             
             # Extract GPA if mentioned
-            gpa_match = re.search(r'GPA\s*(?:of|:)?\s*(\d+\.\d+|\d+\,\d+)', line, re.IGNORECASE)
+            gpa_match = _GPA_RE.search(line)
             if gpa_match:
                 if "description" not in edu:
                     edu["description"] = ""
                 edu["description"] += f"<p>GPA: {gpa_match.group(1)}</p>"
         
         # If institution not found but first line looks like institution (capitalized words)
-        if not institution_found and lines and re.match(r'^[A-Z]', lines[0]):
+        if not institution_found and lines and _CAPITAL_START_RE.match(lines[0]):
             # Check if first line doesn't have a degree keyword
-            if not any(re.search(r'\b' + re.escape(keyword) + r'\b', lines[0], re.IGNORECASE) for keyword in degree_keywords):
+            if not _ANY_DEGREE_RE.search(lines[0]):
                 edu["institution"] = lines[0].strip()
         
         # If degree not found but second line might contain it
         if not degree_found and len(lines) > 1:
             second_line = lines[1].strip()
-            if any(re.search(r'\b' + re.escape(keyword) + r'\b', second_line, re.IGNORECASE) for keyword in degree_keywords):
+            if _ANY_DEGREE_RE.search(second_line):
                 edu["degree"] = second_line
         
         # Try to fill in gaps with educated guesses based on structure
@@ -830,11 +948,11 @@ def extract_education(text: str, section_range: Tuple[int, int]) -> List[Dict[st
             elif " - " in lines[0]:
                 # Format might be "Degree - Institution"
                 parts = lines[0].split(" - ", 1)
-                if any(keyword in parts[0].lower() for keyword in degree_keywords):
+                if any(keyword in parts[0].lower() for keyword in _DEGREE_KEYWORDS):
                     edu["degree"] = parts[0].strip()
                     if len(parts) > 1:
                         edu["institution"] = parts[1].strip()
-                elif any(keyword in parts[1].lower() for keyword in degree_keywords):
+                elif any(keyword in parts[1].lower() for keyword in _DEGREE_KEYWORDS):
                     edu["institution"] = parts[0].strip()
                     edu["degree"] = parts[1].strip()
                 else:
@@ -844,7 +962,7 @@ def extract_education(text: str, section_range: Tuple[int, int]) -> List[Dict[st
         # Normalize degree values for consistency
         if "degree" in edu:
             degree = edu["degree"].lower()
-            if re.search(r'\bbach|b\.?s|b\.?a|b\.?eng|b\.?tech\b', degree):
+            if _BACHELOR_RE.search(degree):
                 if "science" in degree or "s" in degree:
                     edu["degree"] = "Bachelor of Science"
                 elif "art" in degree or "a" in degree:
@@ -859,7 +977,7 @@ def extract_education(text: str, section_range: Tuple[int, int]) -> List[Dict[st
                     edu["degree"] = "Bachelor's Degree"
                 else:
                     edu["degree"] = "Bachelor's Degree"
-            elif re.search(r'\bmast|m\.?s|m\.?a|m\.?eng|m\.?tech\b', degree):
+            elif _MASTER_RE.search(degree):
                 if "science" in degree or "s" in degree:
                     edu["degree"] = "Master of Science"
                 elif "art" in degree or "a" in degree:
@@ -872,9 +990,9 @@ def extract_education(text: str, section_range: Tuple[int, int]) -> List[Dict[st
                     edu["degree"] = "Master of Business Administration"
                 else:
                     edu["degree"] = "Master's Degree"
-            elif re.search(r'\bphd|ph\.?d|doct\b', degree):
+            elif _PHD_RE.search(degree):
                 edu["degree"] = "Ph.D."
-            elif re.search(r'\bassoc|a\.?a\b', degree):
+            elif _ASSOCIATE_RE.search(degree):
                 edu["degree"] = "Associate's Degree"
         
         # Ensure all required fields have values
@@ -889,7 +1007,7 @@ def extract_education(text: str, section_range: Tuple[int, int]) -> List[Dict[st
         # Look for any lines that might indicate education
         for i, line in enumerate(section_lines[1:]):
             line = line.strip()
-            if any(keyword in line.lower() for keyword in degree_keywords + institution_keywords):
+            if any(keyword in line.lower() for keyword in _DEGREE_KEYWORDS + _INSTITUTION_KEYWORDS):
                 edu = {
                     "id": f"edu-{i+1}",
                     "degree": "",
@@ -901,7 +1019,7 @@ def extract_education(text: str, section_range: Tuple[int, int]) -> List[Dict[st
                 }
                 
                 # Try to determine if this is more likely a degree or institution
-                if any(keyword in line.lower() for keyword in degree_keywords):
+                if any(keyword in line.lower() for keyword in _DEGREE_KEYWORDS):
                     edu["degree"] = line
                     edu["institution"] = ""
                 
@@ -909,26 +1027,9 @@ def extract_education(text: str, section_range: Tuple[int, int]) -> List[Dict[st
     
     return education
 
-def extract_skills(text: str, section_range: Tuple[int, int]) -> List[str]:
-    """
-    Extract skills from the resume with improved accuracy for technical and soft skills
-    
-    Args:
-        text: Full resume text
-        section_range: (start, end) positions of the skills section
-        
-    Returns:
-        List of skills
-    """
-    skills = []
-    section_text = text[section_range[0]:section_range[1]]
-    
-    # Skip the header line
-    section_lines = section_text.split('\n')
-    section_content = ' '.join([line.strip() for line in section_lines[1:]])
-    
-    # Define common skill categories with their typical terms
-    technical_skills = {
+# Common skill categories with their typical terms; hoisted to module scope
+# so extract_skills doesn't rebuild the vocabularies on every call
+_TECHNICAL_SKILLS = {
         "programming_languages": [
             "python", "java", "javascript", "typescript", "c++", "c#", "ruby", 
             "php", "go", "swift", "kotlin", "rust", "scala", "perl", "r", 
@@ -974,18 +1075,110 @@ def extract_skills(text: str, section_range: Tuple[int, int]) -> List[str]:
             "puppeteer", "playwright", "jmeter", "junit", "pytest", "testng", 
             "rspec", "cucumber"
         ]
-    }
-    
-    soft_skills = [
-        "problem solving", "communication", "teamwork", "leadership", 
-        "time management", "critical thinking", "adaptability", "creativity", 
-        "project management", "emotional intelligence", "conflict resolution", 
-        "decision making", "analytical thinking", "attention to detail", 
-        "organization", "collaboration", "negotiation", "mentoring", 
-        "coaching", "public speaking", "presentation", "research", 
-        "writing", "agile", "scrum", "kanban", "lean"
-    ]
-    
+}
+
+_SOFT_SKILLS = [
+    "problem solving", "communication", "teamwork", "leadership",
+    "time management", "critical thinking", "adaptability", "creativity",
+    "project management", "emotional intelligence", "conflict resolution",
+    "decision making", "analytical thinking", "attention to detail",
+    "organization", "collaboration", "negotiation", "mentoring",
+    "coaching", "public speaking", "presentation", "research",
+    "writing", "agile", "scrum", "kanban", "lean"
+]
+
+# Display casing for matched terms: acronyms rendered uppercase, plus
+# special-case spellings for languages and frameworks
+_SKILL_ACRONYMS = frozenset(["AWS", "GCP", "CSS", "HTML", "API", "SQL", "UI", "UX", "TDD", "BDD", "CI/CD"])
+_EXPERIENCE_ACRONYMS = frozenset(["AWS", "GCP", "API"])
+
+_LANGUAGE_CASES = {
+    "javascript": "JavaScript",
+    "typescript": "TypeScript",
+    "python": "Python",
+    "java": "Java",
+    "c++": "C++",
+    "c#": "C#",
+    "php": "PHP",
+    "ruby": "Ruby",
+    "swift": "Swift",
+    "kotlin": "Kotlin",
+    "rust": "Rust",
+    "go": "Go"
+}
+
+_FRAMEWORK_CASES = {
+    "react": "React",
+    "angular": "Angular",
+    "vue": "Vue.js",
+    "django": "Django",
+    "flask": "Flask",
+    "express": "Express.js",
+    "spring": "Spring",
+    "rails": "Ruby on Rails",
+    "jquery": "jQuery",
+    "node.js": "Node.js",
+    "next.js": "Next.js",
+    "mongodb": "MongoDB",
+    "postgresql": "PostgreSQL",
+    "mysql": "MySQL"
+}
+
+_LOWERCASE_JOIN_WORDS = frozenset(["of", "the", "and", "in", "on", "with", "for"])
+
+def _title_case_term(term: str) -> str:
+    """Capitalize a multi-word skill, keeping connective words lowercase."""
+    return " ".join(
+        word.capitalize() if word.lower() not in _LOWERCASE_JOIN_WORDS else word.lower()
+        for word in term.split()
+    )
+
+# Lowered term -> sort rank, flattened once so the final ordering is a
+# single dict lookup per skill instead of scanning every category list
+_SKILL_PRIORITY: Dict[str, int] = {}
+for _rank, _category in enumerate([
+    "programming_languages", "frameworks_libraries", "databases",
+    "cloud_infrastructure", "web_technologies", "data_science", "testing"
+]):
+    for _term in _TECHNICAL_SKILLS[_category]:
+        _SKILL_PRIORITY.setdefault(_term.lower(), _rank)
+for _term in _SOFT_SKILLS:
+    _SKILL_PRIORITY.setdefault(_term.lower(), 7)
+
+# Per-term word-boundary patterns compiled once, plus an automaton that
+# prefilters which terms occur at all so only those few get a regex scan.
+# The automaton alone can't be trusted: it also fires on substrings like
+# 'java' inside 'javascript', which the \b pattern then rejects
+_ALL_SKILL_TERMS = tuple(dict.fromkeys(
+    [_t for _terms in _TECHNICAL_SKILLS.values() for _t in _terms] + _SOFT_SKILLS
+))
+_SKILL_TERM_RES = {_t: re.compile(r'\b' + re.escape(_t) + r'\b') for _t in _ALL_SKILL_TERMS}
+_SKILL_TERM_AC = _build_automaton(_ALL_SKILL_TERMS)
+
+def extract_skills(
+    text: str,
+    section_range: Tuple[int, int],
+    sections: Optional[Dict[str, Tuple[int, int]]] = None,
+) -> List[str]:
+    """
+    Extract skills from the resume with improved accuracy for technical and soft skills
+
+    Args:
+        text: Full resume text
+        section_range: (start, end) positions of the skills section
+        sections: Optional precomputed section map from identify_resume_sections,
+            to avoid rescanning the full text for section headers
+
+    Returns:
+        List of skills
+    """
+    skills = []
+    section_text = text[section_range[0]:section_range[1]]
+
+    # Skip the header line
+    section_lines = section_text.split('\n')
+    section_content = ' '.join([line.strip() for line in section_lines[1:]])
+
     # Try different delimiters for skills
     delimiters = [',', '|', '•', '·', ':', '-', '/', '\\', '  ']
     
@@ -999,124 +1192,84 @@ def extract_skills(text: str, section_range: Tuple[int, int]) -> List[str]:
     # If we don't have many skills yet, try to find bullet points
     if len(skills) < 3:
         # Look for bullet point lists
-        bullet_pattern = r'[•\-\*]\s*([^•\-\*\n]+)'
-        bullet_matches = re.findall(bullet_pattern, section_text)
+        bullet_matches = _SKILL_BULLET_RE.findall(section_text)
         if bullet_matches:
             skills = [match.strip() for match in bullet_matches if match.strip()]
     
     # If skills list is still small, try to extract from the whole resume text
     extracted_skills = skills.copy()
+
+    # Lowered forms of everything collected so far; appends below keep this
+    # in sync so membership checks are O(1) instead of rescanning the list
+    seen_skills = {s.lower() for s in extracted_skills}
+
     if len(extracted_skills) < 10:
         # Try to identify skills from the rest of the resume
         full_text = text.lower()
-        
+        candidate_terms = {term for _, term in _SKILL_TERM_AC.iter(full_text)}
+
         # Check for technical skill keywords
-        for category, terms in technical_skills.items():
+        for category, terms in _TECHNICAL_SKILLS.items():
             for term in terms:
                 # For exact skill names, search for word boundaries
-                if re.search(r'\b' + re.escape(term) + r'\b', full_text):
+                if term in candidate_terms and _SKILL_TERM_RES[term].search(full_text):
                     # Normalize skill name (capitalize properly)
-                    if term not in [s.lower() for s in extracted_skills]:
-                        if term.upper() in ["AWS", "GCP", "CSS", "HTML", "API", "SQL", "UI", "UX", "TDD", "BDD", "CI/CD"]:
-                            extracted_skills.append(term.upper())
+                    if term not in seen_skills:
+                        if term.upper() in _SKILL_ACRONYMS:
+                            skill_name = term.upper()
                         elif " " in term:  # multi-word terms
-                            extracted_skills.append(" ".join(word.capitalize() if word.lower() not in ["of", "the", "and", "in", "on", "with", "for"] else word.lower() for word in term.split()))
+                            skill_name = _title_case_term(term)
                         else:
                             # Special cases for programming languages
-                            language_cases = {
-                                "javascript": "JavaScript",
-                                "typescript": "TypeScript",
-                                "python": "Python",
-                                "java": "Java",
-                                "c++": "C++",
-                                "c#": "C#",
-                                "php": "PHP",
-                                "ruby": "Ruby",
-                                "swift": "Swift",
-                                "kotlin": "Kotlin",
-                                "rust": "Rust",
-                                "go": "Go"
-                            }
-                            if term in language_cases:
-                                extracted_skills.append(language_cases[term])
-                            else:
-                                extracted_skills.append(term.capitalize())
-        
+                            skill_name = _LANGUAGE_CASES.get(term, term.capitalize())
+                        extracted_skills.append(skill_name)
+                        seen_skills.add(skill_name.lower())
+
         # Check for soft skills as well
-        for skill in soft_skills:
-            if re.search(r'\b' + re.escape(skill) + r'\b', full_text) and skill not in [s.lower() for s in extracted_skills]:
+        for skill in _SOFT_SKILLS:
+            if skill not in seen_skills and skill in candidate_terms and _SKILL_TERM_RES[skill].search(full_text):
                 # Capitalize properly for presentation
-                extracted_skills.append(" ".join(word.capitalize() if word.lower() not in ["of", "the", "and", "in", "on", "with", "for"] else word.lower() for word in skill.split()))
+                skill_name = _title_case_term(skill)
+                extracted_skills.append(skill_name)
+                seen_skills.add(skill_name.lower())
     
     # Look for frameworks and libraries in work experience sections
-    experience_section_range = None
-    for section_type, range_tuple in identify_resume_sections(text).items():
-        if section_type == "experience":
-            experience_section_range = range_tuple
-            break
+    if sections is None:
+        sections = identify_resume_sections(text)
+    experience_section_range = sections.get("experience")
     
     if experience_section_range:
         experience_text = text[experience_section_range[0]:experience_section_range[1]].lower()
-        
+        experience_candidates = {term for _, term in _SKILL_TERM_AC.iter(experience_text)}
+
         # Check for frameworks and technologies in experience descriptions
         for category in ["frameworks_libraries", "databases", "cloud_infrastructure"]:
-            for term in technical_skills[category]:
-                if re.search(r'\b' + re.escape(term) + r'\b', experience_text) and term not in [s.lower() for s in extracted_skills]:
-                    if term.upper() in ["AWS", "GCP", "API"]:
-                        extracted_skills.append(term.upper())
+            for term in _TECHNICAL_SKILLS[category]:
+                if term not in seen_skills and term in experience_candidates and _SKILL_TERM_RES[term].search(experience_text):
+                    if term.upper() in _EXPERIENCE_ACRONYMS:
+                        skill_name = term.upper()
                     elif " " in term:
-                        extracted_skills.append(" ".join(word.capitalize() if word.lower() not in ["of", "the", "and", "in", "on", "with", "for"] else word.lower() for word in term.split()))
+                        skill_name = _title_case_term(term)
                     else:
-                        framework_cases = {
-                            "react": "React",
-                            "angular": "Angular",
-                            "vue": "Vue.js",
-                            "django": "Django",
-                            "flask": "Flask",
-                            "express": "Express.js",
-                            "spring": "Spring",
-                            "rails": "Ruby on Rails",
-                            "jquery": "jQuery",
-                            "node.js": "Node.js",
-                            "next.js": "Next.js",
-                            "mongodb": "MongoDB",
-                            "postgresql": "PostgreSQL",
-                            "mysql": "MySQL"
-                        }
-                        if term in framework_cases:
-                            extracted_skills.append(framework_cases[term])
-                        else:
-                            extracted_skills.append(term.capitalize())
-    
+                        skill_name = _FRAMEWORK_CASES.get(term, term.capitalize())
+                    extracted_skills.append(skill_name)
+                    seen_skills.add(skill_name.lower())
+
     # Deduplicate and sort
     unique_skills = []
+    deduped = set()
     for skill in extracted_skills:
-        if skill.lower() not in [s.lower() for s in unique_skills]:
+        skill_lower = skill.lower()
+        if skill_lower not in deduped:
+            deduped.add(skill_lower)
             unique_skills.append(skill)
-    
+
     # Sort skills: programming languages first, then frameworks, databases, etc.
     def get_skill_priority(skill):
-        skill_lower = skill.lower()
-        if any(lang.lower() == skill_lower for lang in technical_skills["programming_languages"]):
-            return 0
-        if any(framework.lower() == skill_lower for framework in technical_skills["frameworks_libraries"]):
-            return 1
-        if any(db.lower() == skill_lower for db in technical_skills["databases"]):
-            return 2
-        if any(cloud.lower() == skill_lower for cloud in technical_skills["cloud_infrastructure"]):
-            return 3
-        if any(web.lower() == skill_lower for web in technical_skills["web_technologies"]):
-            return 4
-        if any(data.lower() == skill_lower for data in technical_skills["data_science"]):
-            return 5
-        if any(test.lower() == skill_lower for test in technical_skills["testing"]):
-            return 6
-        if any(soft.lower() == skill_lower for soft in soft_skills):
-            return 7
-        return 8
-    
+        return _SKILL_PRIORITY.get(skill.lower(), 8)
+
     sorted_skills = sorted(unique_skills, key=get_skill_priority)
-    
+
     return sorted_skills
 
 def extract_projects(text: str, section_range: Tuple[int, int]) -> List[Dict[str, str]]:
@@ -1139,8 +1292,7 @@ def extract_projects(text: str, section_range: Tuple[int, int]) -> List[Dict[str
     
     # Try to identify individual projects
     # Project names are often capitalized and followed by description
-    project_entries = re.findall(r'([A-Z][A-Za-z0-9\s&\-\'\(\)]+)(?:\n|\s{2,})(.+?)(?=(?:[A-Z][A-Za-z0-9\s&\-\'\(\)]+(?:\n|\s{2,}))|$)', 
-                             section_content, re.DOTALL)
+    project_entries = _PROJECT_ENTRY_RE.findall(section_content)
     
     for i, (name, description) in enumerate(project_entries):
         project = {}
@@ -1150,7 +1302,7 @@ def extract_projects(text: str, section_range: Tuple[int, int]) -> List[Dict[str
         desc = description.strip()
         
         # Try to extract technologies/tech stack
-        tech_match = re.search(r'(?:technologies|tech stack|built with)[:\s]*([^\.]+)', desc, re.IGNORECASE)
+        tech_match = _TECH_STACK_RE.search(desc)
         if tech_match:
             project["technologies"] = tech_match.group(1).strip()
             # Remove this part from the description
@@ -1159,7 +1311,7 @@ def extract_projects(text: str, section_range: Tuple[int, int]) -> List[Dict[str
             project["technologies"] = ""
         
         # Try to extract links
-        link_match = re.search(r'(https?://(?:www\.)?[a-zA-Z0-9\.\-]+\.[a-zA-Z]{2,}(?:/[a-zA-Z0-9\.\-_~:/\?#\[\]@!\$&\'\(\)\*\+,;=]*)?)', desc)
+        link_match = _URL_RE.search(desc)
         if link_match:
             project["link"] = link_match.group(1)
             # Remove this part from the description
@@ -1176,7 +1328,7 @@ def extract_projects(text: str, section_range: Tuple[int, int]) -> List[Dict[str
                 for line in lines:
                     line = line.strip()
                     if line.startswith(('•', '-', '*')):
-                        line = re.sub(r'^[•\*\-]\s*', '', line)
+                        line = _BULLET_CHAR_STRIP_RE.sub('', line)
                         bullets.append(f"<li>{line}</li>")
                 if bullets:
                     project["description"] = f"<ul>{''.join(bullets)}</ul>"
@@ -1377,11 +1529,11 @@ def extract_summary(text: str, section_range: Tuple[int, int]) -> str:
     section_content = '\n'.join(section_lines[1:])
     
     # Clean the summary text
-    summary = re.sub(r'\s+', ' ', section_content).strip()
-    
+    summary = _WS_RUN_RE.sub(' ', section_content).strip()
+
     # Check if the summary is actually a list of bullet points
-    if re.search(r'(?:\n|^)[•\*\-]\s', section_content):
-        bullet_points = re.findall(r'[•\*\-]\s+([^\n•\*\-]+)', section_content)
+    if _BULLET_LINE_START_RE.search(section_content):
+        bullet_points = _BULLET_TEXT_RE.findall(section_content)
         if bullet_points:
             # Transform bullet points into a coherent paragraph
             summary = ' '.join([point.strip() for point in bullet_points])
@@ -1393,7 +1545,7 @@ def extract_summary(text: str, section_range: Tuple[int, int]) -> str:
         extended_text = text[section_range[0]:section_range[1] + 500]
         
         # Find the next section header if any
-        next_section_match = re.search(r'\n[A-Z][A-Z\s]+:?(?:\n|$)', extended_text)
+        next_section_match = _CAPS_HEADER_RE.search(extended_text)
         if next_section_match:
             extended_text = extended_text[:next_section_match.start()]
         
@@ -1403,58 +1555,51 @@ def extract_summary(text: str, section_range: Tuple[int, int]) -> str:
             extended_content = '\n'.join(extended_lines[1:])
             
             # Check for bullet points in the extended content
-            if re.search(r'(?:\n|^)[•\*\-]\s', extended_content):
-                bullet_points = re.findall(r'[•\*\-]\s+([^\n•\*\-]+)', extended_content)
+            if _BULLET_LINE_START_RE.search(extended_content):
+                bullet_points = _BULLET_TEXT_RE.findall(extended_content)
                 if bullet_points:
                     summary = ' '.join([point.strip() for point in bullet_points])
             else:
                 # Clean the extended summary
-                summary = re.sub(r'\s+', ' ', extended_content).strip()
+                summary = _WS_RUN_RE.sub(' ', extended_content).strip()
     
     # Sometimes summaries are outside the specific "summary" section
     # If our summary is too short, try to find it elsewhere
     if len(summary) < 50:
         # Try to find a summary at the beginning of the resume (common location)
-        first_section_match = re.search(r'\n[A-Z][A-Z\s]+:?(?:\n|$)', text[:500])
+        first_section_match = _CAPS_HEADER_RE.search(text[:500])
         
         if first_section_match:
             # If summary wasn't the first section, check the text before the first section
             top_text = text[:first_section_match.start()].strip()
             
             # Skip contact information which is often at the top
-            if not re.search(r'@|[0-9]{3}[-.]?[0-9]{3}[-.]?[0-9]{4}', top_text):
+            if not _CONTACT_LINE_RE.search(top_text):
                 # This might be a summary or objective that wasn't labeled as such
                 if len(top_text) > 50:
                     return top_text
         
         # Try to find a labeled summary or objective elsewhere in the resume
         # This handles cases where the section detection didn't identify it properly
-        common_summary_headers = [
-            r'SUMMARY', r'PROFESSIONAL SUMMARY', r'CAREER SUMMARY', 
-            r'OBJECTIVE', r'CAREER OBJECTIVE', r'PROFESSIONAL OBJECTIVE',
-            r'PROFILE', r'PROFESSIONAL PROFILE', r'ABOUT ME'
-        ]
-        
-        for header in common_summary_headers:
+        for header_pattern in _SUMMARY_HEADER_RES:
             # Look for the header followed by text
-            summary_match = re.search(r'(?:\n|^)' + header + r'[:\s]*\n+(.+?)(?=\n\n|\n[A-Z][A-Z\s]+:?|\Z)', 
-                                    text, re.IGNORECASE | re.DOTALL)
+            summary_match = header_pattern.search(text)
             if summary_match:
                 alt_summary = summary_match.group(1).strip()
                 if alt_summary and len(alt_summary) > len(summary):
                     # Check if it's a list of bullet points
-                    if re.search(r'(?:\n|^)[•\*\-]\s', alt_summary):
-                        bullet_points = re.findall(r'[•\*\-]\s+([^\n•\*\-]+)', alt_summary)
+                    if _BULLET_LINE_START_RE.search(alt_summary):
+                        bullet_points = _BULLET_TEXT_RE.findall(alt_summary)
                         if bullet_points:
                             alt_summary = ' '.join([point.strip() for point in bullet_points])
-                    
-                    summary = re.sub(r'\s+', ' ', alt_summary).strip()
+
+                    summary = _WS_RUN_RE.sub(' ', alt_summary).strip()
                     break
     
     # Final cleanup and validation
     
     # Remove unnecessary words like "Summary:" that might be included
-    summary = re.sub(r'^(?:Summary|Objective|Profile|About):\s*', '', summary, flags=re.IGNORECASE)
+    summary = _SUMMARY_LABEL_RE.sub('', summary)
     
     # Ensure the summary is a complete sentence or paragraph
     if summary and not summary.endswith(('.', '!', '?')):
@@ -1464,16 +1609,16 @@ def extract_summary(text: str, section_range: Tuple[int, int]) -> str:
     # for a paragraph that might be a summary
     if len(summary) < 50:
         intro_text = text[:1000]
-        paragraphs = re.split(r'\n\s*\n', intro_text)
-        
+        paragraphs = _BLANK_LINE_SPLIT_RE.split(intro_text)
+
         for para in paragraphs:
             # Skip contact info, very short paragraphs, or obvious headers
-            if re.search(r'@|[0-9]{3}[-.]?[0-9]{3}[-.]?[0-9]{4}', para) or len(para) < 50 or para.isupper():
+            if _CONTACT_LINE_RE.search(para) or len(para) < 50 or para.isupper():
                 continue
-                
-            if not re.match(r'(?:EXPERIENCE|EDUCATION|SKILLS|PROJECTS|WORK|EMPLOYMENT)\b', para, re.IGNORECASE):
+
+            if not _INTRO_SECTION_WORD_RE.match(para):
                 # This could be a summary
-                potential_summary = re.sub(r'\s+', ' ', para).strip()
+                potential_summary = _WS_RUN_RE.sub(' ', para).strip()
                 
                 # Use this if it's longer than what we have
                 if len(potential_summary) > len(summary):
@@ -1483,7 +1628,7 @@ def extract_summary(text: str, section_range: Tuple[int, int]) -> str:
     # Ensure the summary is a reasonable length for ATS
     if len(summary) > 1000:
         # Truncate at a sentence boundary
-        sentences = re.split(r'(?<=[.!?])\s+', summary[:1000])
+        sentences = _SENTENCE_SPLIT_RE.split(summary[:1000])
         summary = ' '.join(sentences[:-1])
     
     return summary 
\ No newline at end of file
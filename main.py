@@ -14,6 +14,7 @@ from app.models.user import User
 from app.models.otp import OTP
 from app.models.doc import Doc, doc_relationships
 from app.utils.errors import AuthError
+from app.services.resume_enhance import close_http_session
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -25,6 +26,11 @@ async def startup_event():
     # Create tables
     Base.metadata.create_all(bind=engine)
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    # Release pooled HTTP connections used for Gemini calls
+    await close_http_session()
+
 # Set up CORS middleware
 app.add_middleware(
     CORSMiddleware,